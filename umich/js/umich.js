@@ -1,22 +1,18 @@
 function showHeadlines()
 {
-    $( '.item' ).each( function() {
-        closeItem( $(this) );
-    });
+    closeItem( $( '.item' ) );
 }
 
 function showFullText() {
-    $( '.item' ).each( function() {
-        openItem( $(this) );
-        hideItemSnippet( $(this) );
-    });
+    var $items = $( '.item' );
+    openItem( $items );
+    hideItemSnippet( $items );
 }
 
 function showSnippets() {
-    $( '.item' ).each( function() {
-        openItem( $(this) );
-        showItemSnippet( $(this) );
-    });
+    var $items = $( '.item' );
+    openItem( $items );
+    showItemSnippet( $items );
 }
 
 function onCloseItem() {